@@ -3,20 +3,56 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import functools
 import getpass
+import inspect
 import os
 import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Literal, Optional, Sequence
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import httpx
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tavily import TavilyClient
 
-from deepagents import create_deep_agent
+# The LangChain, Gemini, and deepagents stacks pull in thousands of
+# modules, so they are imported where used to keep `import deep_agent.agent`
+# and `deep-agent --help` fast.
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessageChunk
+    from langchain_core.tools import BaseTool, StructuredTool
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from tavily import TavilyClient
 
 SearchTopic = Literal["general", "news", "finance"]
+SearchCacheKey = Tuple[str, int, str, bool]
+
+STREAMED_EVENT_TYPES = frozenset({"on_tool_end", "on_chat_model_stream"})
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
 
+# Keep this static (no timestamps or per-request text): Gemini 2.5 models cache
+# repeated request prefixes implicitly, so an identical system prompt across
+# turns and subagents is what lets prefill be served from cache.
 DEFAULT_SYSTEM_PROMPT = """You are an expert researcher. Your job is to conduct thorough research and then write a polished report.
 
 You have access to an internet search tool as your primary means of gathering information.
@@ -24,6 +60,10 @@ You have access to an internet search tool as your primary means of gathering in
 ## `internet_search`
 
 Use this to run an internet search for a given query. You can specify the max number of results to return, the topic, and whether raw content should be included.
+
+## `internet_search_batch`
+
+Use this instead of several `internet_search` calls when you already know a set of independent queries. All queries run concurrently and the results come back together.
 """
 
 
@@ -34,17 +74,55 @@ class ResearchAgentConfig:
     model: str = "gemini-2.5-flash-lite"
     system_prompt: str = DEFAULT_SYSTEM_PROMPT
     prompt_for_google_key: bool = True
+    use_keyring: bool = True
+
+
+_DOTENV_LOADED_FLAG = "_DEEP_AGENT_DOTENV_LOADED"
+
+# Load as soon as the module is imported, but only once per process tree so
+# re-imports (e.g. notebook reloads) don't re-walk the filesystem for `.env`.
+if not os.environ.get(_DOTENV_LOADED_FLAG):
+    load_dotenv()
+    os.environ[_DOTENV_LOADED_FLAG] = "1"
+
+
+KEYRING_SERVICE = "deep-agent"
 
 
-load_dotenv()  # load as soon as the module is imported
+def _keyring_get(var_name: str) -> Optional[str]:
+    """Return a secret stored in the OS keyring, or None if unavailable."""
+    import keyring
+    from keyring.errors import KeyringError
 
+    try:
+        return keyring.get_password(KEYRING_SERVICE, var_name)
+    except KeyringError:
+        return None
 
-def _require_env(var_name: str, *, prompt_if_missing: bool = False) -> str:
-    """Return env variable or optionally prompt and set it."""
+
+def _keyring_set(var_name: str, value: str) -> None:
+    """Store a secret in the OS keyring, ignoring hosts without a usable backend."""
+    import keyring
+    from keyring.errors import KeyringError
+
+    try:
+        keyring.set_password(KEYRING_SERVICE, var_name, value)
+    except KeyringError:
+        pass
+
+
+def _require_env(var_name: str, *, prompt_if_missing: bool = False, use_keyring: bool = False) -> str:
+    """Return env variable, falling back to the OS keyring and then optionally a prompt."""
     value = os.getenv(var_name)
     if value:
         return value
 
+    if use_keyring:
+        stored = _keyring_get(var_name)
+        if stored:
+            os.environ[var_name] = stored
+            return stored
+
     if not prompt_if_missing:
         raise ValueError(f"{var_name} must be set in the environment variables.")
 
@@ -52,11 +130,122 @@ def _require_env(var_name: str, *, prompt_if_missing: bool = False) -> str:
     if not entered:
         raise ValueError(f"{var_name} is required.")
     os.environ[var_name] = entered
+    if use_keyring:
+        _keyring_set(var_name, entered)
     return entered
 
 
-def build_internet_search_tool(client: TavilyClient) -> Callable[..., Dict[str, Any]]:
-    """Return a callable compatible with deepagents' tool interface."""
+@functools.lru_cache(maxsize=4)
+def _get_chat_model(model: str) -> ChatGoogleGenerativeAI:
+    """Return a Gemini chat model for `model`, reused across agent builds."""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(model=model)
+
+
+_HTTP: Optional[httpx.Client] = None
+_HTTP_LOCK = threading.Lock()  # batch searches and parallel subtasks race to create clients
+# Async connections belong to the loop that opened them, so each loop gets its
+# own client; entries drop out when a loop is garbage collected.
+_ASYNC_HTTP: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_http() -> httpx.Client:
+    """Return the shared keep-alive HTTP client used for blocking Tavily searches."""
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is None:
+            _HTTP = httpx.Client(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+            atexit.register(_HTTP.close)
+        return _HTTP
+
+
+def _get_async_http() -> httpx.AsyncClient:
+    """Return the running loop's async HTTP client used for concurrent Tavily searches."""
+    loop = asyncio.get_running_loop()
+    with _HTTP_LOCK:
+        client = _ASYNC_HTTP.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+            _ASYNC_HTTP[loop] = client
+        return client
+
+
+@atexit.register
+def _close_async_http() -> None:
+    """Close async clients whose loops can still run their shutdown."""
+    with _HTTP_LOCK:
+        clients = list(_ASYNC_HTTP.items())
+    for loop, client in clients:
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(client.aclose())
+    _ASYNC_HTTP.clear()
+
+
+def _tavily_request(
+    api_key: str,
+    query: str,
+    max_results: int,
+    topic: SearchTopic,
+    include_raw_content: bool,
+) -> Dict[str, Any]:
+    """Return keyword arguments for a Tavily search POST."""
+    return {
+        "url": TAVILY_SEARCH_URL,
+        "json": {
+            "query": query,
+            "max_results": max_results,
+            "topic": topic,
+            "include_raw_content": include_raw_content,
+        },
+        "headers": {"Authorization": f"Bearer {api_key}"},
+    }
+
+
+def build_internet_search_tool(
+    client: Union[str, TavilyClient],
+    *,
+    cache: Optional[MutableMapping[SearchCacheKey, Dict[str, Any]]] = None,
+) -> BaseTool:
+    """Return a search tool with sync and async entry points for deepagents.
+
+    `client` is a Tavily API key or a `TavilyClient`. Only a client's `api_key`
+    is used, so its other settings (proxies, base URL) are ignored. Both paths
+    call the Tavily REST API over shared keep-alive HTTP/2 clients, so repeated
+    searches skip the TCP/TLS handshake. The async path lets the agent runtime
+    run several searches from a single model turn concurrently instead of one
+    after another. Results are cached by their arguments; pass any mutable
+    mapping as `cache` to swap the default in-process TTL cache for a shared
+    backend. `tool.func.cache_clear()` empties it.
+    """
+    from langchain_core.tools import StructuredTool
+
+    api_key = client if isinstance(client, str) else client.api_key
+    if cache is None:
+        cache = TTLCache(maxsize=1024, ttl=600)  # web results go stale
+    cache_lock = threading.Lock()
+
+    def _cache_get(key: SearchCacheKey) -> Optional[Dict[str, Any]]:
+        with cache_lock:
+            return cache.get(key)
+
+    def _cache_set(key: SearchCacheKey, value: Dict[str, Any]) -> None:
+        with cache_lock:
+            cache[key] = value
+
+    def cache_clear() -> None:
+        with cache_lock:
+            cache.clear()
 
     def internet_search(
         query: str,
@@ -65,33 +254,199 @@ def build_internet_search_tool(client: TavilyClient) -> Callable[..., Dict[str,
         include_raw_content: bool = False,
     ) -> Dict[str, Any]:
         """Run a Tavily web search."""
-        return client.search(
-            query,
-            max_results=max_results,
-            include_raw_content=include_raw_content,
-            topic=topic,
+        key = (query, max_results, topic, include_raw_content)
+        hit = _cache_get(key)
+        if hit is not None:
+            return hit
+        response = _get_http().post(
+            **_tavily_request(api_key, query, max_results, topic, include_raw_content)
         )
+        response.raise_for_status()
+        result = response.json()
+        _cache_set(key, result)
+        return result
 
-    return internet_search
+    async def ainternet_search(
+        query: str,
+        max_results: int = 5,
+        topic: SearchTopic = "general",
+        include_raw_content: bool = False,
+    ) -> Dict[str, Any]:
+        """Run a Tavily web search without blocking the event loop."""
+        key = (query, max_results, topic, include_raw_content)
+        hit = _cache_get(key)
+        if hit is not None:
+            return hit
+        response = await _get_async_http().post(
+            **_tavily_request(api_key, query, max_results, topic, include_raw_content)
+        )
+        response.raise_for_status()
+        result = response.json()
+        _cache_set(key, result)
+        return result
+
+    internet_search.cache_clear = cache_clear  # type: ignore[attr-defined]
+
+    return StructuredTool.from_function(
+        func=internet_search,
+        coroutine=ainternet_search,
+        name="internet_search",
+    )
+
+
+def build_internet_search_batch_tool(search_tool: StructuredTool) -> BaseTool:
+    """Return a tool that runs several independent queries through `search_tool` at once.
+
+    Letting the model cover N queries in one tool call saves N-1 model round trips.
+    Failed queries are reported per entry rather than failing the whole batch.
+    If `search_tool` has no coroutine, the async path runs its `func` in threads.
+    """
+    from langchain_core.tools import StructuredTool
+
+    def _entry(query: str, outcome: Any) -> Dict[str, Any]:
+        if isinstance(outcome, BaseException):
+            return {"query": query, "error": str(outcome)}
+        return {"query": query, "result": outcome}
+
+    def internet_search_batch(
+        queries: List[str],
+        max_results: int = 5,
+        topic: SearchTopic = "general",
+    ) -> Dict[str, Any]:
+        """Run several Tavily web searches concurrently."""
+
+        def _search(query: str) -> Any:
+            try:
+                return search_tool.func(query, max_results=max_results, topic=topic)
+            except Exception as exc:  # noqa: BLE001 - surfaced to the model per query
+                return exc
+
+        if not queries:
+            return {"batch": []}
+        with ThreadPoolExecutor(max_workers=min(len(queries), 16)) as pool:
+            outcomes = list(pool.map(_search, queries))
+        return {"batch": [_entry(q, o) for q, o in zip(queries, outcomes)]}
+
+    async def ainternet_search_batch(
+        queries: List[str],
+        max_results: int = 5,
+        topic: SearchTopic = "general",
+    ) -> Dict[str, Any]:
+        """Run several Tavily web searches concurrently without blocking the event loop."""
+
+        async def _search(query: str) -> Any:
+            if search_tool.coroutine is None:
+                return await asyncio.to_thread(
+                    search_tool.func, query, max_results=max_results, topic=topic
+                )
+            return await search_tool.coroutine(query, max_results=max_results, topic=topic)
+
+        outcomes = await asyncio.gather(*[_search(q) for q in queries], return_exceptions=True)
+        return {"batch": [_entry(q, o) for q, o in zip(queries, outcomes)]}
+
+    return StructuredTool.from_function(
+        func=internet_search_batch,
+        coroutine=ainternet_search_batch,
+        name="internet_search_batch",
+    )
 
 
 def build_research_agent(config: Optional[ResearchAgentConfig] = None):
     """Create a deep agent instance wired with the Tavily search tool."""
+    from deepagents import create_deep_agent
+
     config = config or ResearchAgentConfig()
 
-    tavily_key = _require_env("TAVILY_API_KEY")
-    _require_env("GOOGLE_API_KEY", prompt_if_missing=config.prompt_for_google_key)
+    tavily_key = _require_env("TAVILY_API_KEY", use_keyring=config.use_keyring)
+    _require_env(
+        "GOOGLE_API_KEY",
+        prompt_if_missing=config.prompt_for_google_key,
+        use_keyring=config.use_keyring,
+    )
 
-    tavily_client = TavilyClient(api_key=tavily_key)
-    search_tool = build_internet_search_tool(tavily_client)
+    search_tool = build_internet_search_tool(tavily_key)
+    batch_tool = build_internet_search_batch_tool(search_tool)
 
     return create_deep_agent(
-        tools=[search_tool],
-        model=ChatGoogleGenerativeAI(model=config.model),
+        tools=[search_tool, batch_tool],
+        model=_get_chat_model(config.model),
         system_prompt=config.system_prompt,
     )
 
 
+def _content_text(content: Any) -> str:
+    """Extract printable text from message content (str or content-part list)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, str) or part.get("type") == "text"
+    )
+
+
+def _chunk_text(chunk: AIMessageChunk) -> str:
+    """Extract printable text from a streamed model chunk."""
+    return _content_text(chunk.content)
+
+
+def run_research_query_stream(
+    question: str, *, agent=None, config: Optional[ResearchAgentConfig] = None
+) -> Iterator[str]:
+    """Yield the agent's response text token by token as it is generated.
+
+    Text from every model turn is streamed, including any commentary before a
+    tool call, with a blank line between turns; the final report arrives last.
+    This is the preferred entry point for interactive use; `run_research_query`
+    blocks and returns only the final report.
+    """
+    from langchain_core.messages import AIMessageChunk
+
+    agent = agent or build_research_agent(config)
+    current_id: Optional[str] = None
+    for chunk, _metadata in agent.stream(
+        {"messages": [{"role": "user", "content": question}]},
+        stream_mode="messages",
+    ):
+        if not isinstance(chunk, AIMessageChunk):
+            continue
+        text = _chunk_text(chunk)
+        if not text:
+            continue
+        if chunk.id and chunk.id != current_id:
+            if current_id is not None:
+                yield "\n\n"
+            current_id = chunk.id
+        yield text
+
+
+async def run_research_query_astream(
+    question: str,
+    *,
+    agent=None,
+    config: Optional[ResearchAgentConfig] = None,
+    on_event: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield tool results and model tokens as the agent produces them.
+
+    Each event from `astream_events(version="v2")` whose type is in
+    `STREAMED_EVENT_TYPES` is passed to `on_event` (which may be async) and then
+    yielded, so callers can render or post-process while the agent keeps working.
+    """
+    agent = agent or build_research_agent(config)
+    async for event in agent.astream_events(
+        {"messages": [{"role": "user", "content": question}]},
+        version="v2",
+    ):
+        if event["event"] not in STREAMED_EVENT_TYPES:
+            continue
+        if on_event is not None:
+            outcome = on_event(event)
+            if inspect.isawaitable(outcome):
+                await outcome
+        yield event
+
+
 def run_research_query(question: str, *, agent=None, config: Optional[ResearchAgentConfig] = None):
     """Invoke the agent with a user question and return the final response content."""
     agent = agent or build_research_agent(config)
@@ -102,8 +457,85 @@ def run_research_query(question: str, *, agent=None, config: Optional[ResearchAg
     return result
 
 
+def _response_text(result: Any) -> str:
+    """Return the text of a `run_research_query` result, or "" if no messages came back."""
+    if isinstance(result, dict):
+        return ""
+    return _content_text(result)
+
+
+def _finding_text(outcome: Any) -> str:
+    """Render a subtask outcome from `run_research_query` for the synthesis prompt."""
+    if isinstance(outcome, BaseException):
+        return f"(Research for this subtask failed: {outcome})"
+    return _response_text(outcome) or "(No findings were returned for this subtask.)"
+
+
+def _build_synthesis_prompt(goal: str, subtasks: Sequence[str], findings: Sequence[str]) -> str:
+    sections = "\n\n".join(
+        f"### Subtask {i}: {task}\n\n{finding}"
+        for i, (task, finding) in enumerate(zip(subtasks, findings), start=1)
+    )
+    return (
+        f"Research goal: {goal}\n\n"
+        "The goal was split into subtasks that were researched independently. "
+        "Their findings are below. Synthesize them into a single polished report "
+        "that answers the goal, reconciling any overlaps or contradictions. "
+        "Only search again if a finding is clearly missing.\n\n"
+        f"{sections}"
+    )
+
+
+async def _research_subtasks(subtasks: Sequence[str], agent) -> List[str]:
+    """Run every subtask concurrently on `agent` and return their findings as text."""
+    outcomes = await asyncio.gather(
+        *[asyncio.to_thread(run_research_query, task, agent=agent) for task in subtasks],
+        return_exceptions=True,
+    )
+    if outcomes and all(isinstance(outcome, BaseException) for outcome in outcomes):
+        raise outcomes[0]
+    return [_finding_text(outcome) for outcome in outcomes]
+
+
+async def run_research_query_parallel(
+    goal: str,
+    subtasks: Sequence[str],
+    *,
+    agent=None,
+    config: Optional[ResearchAgentConfig] = None,
+) -> str:
+    """Research each subtask concurrently, then synthesize the findings for `goal`.
+
+    Wall-clock time is roughly the slowest subtask plus one synthesis pass,
+    instead of the sum of all subtasks. A failed subtask is reported to the
+    synthesis pass rather than discarding the others; if every subtask fails,
+    the first error is raised. Returns the synthesized report text.
+    """
+    # Compiled agents hold no per-run state, so one instance serves every subtask.
+    agent = agent or build_research_agent(config)
+    findings = await _research_subtasks(subtasks, agent)
+    synthesis_prompt = _build_synthesis_prompt(goal, subtasks, findings)
+    result = await asyncio.to_thread(run_research_query, synthesis_prompt, agent=agent)
+    return _response_text(result)
+
+
 DEFAULT_CONFIG = ResearchAgentConfig()
-agent = build_research_agent(DEFAULT_CONFIG)
+_AGENT_SINGLETON: Optional[Any] = None
+
+
+def get_agent() -> Any:
+    """Return a shared agent built from `DEFAULT_CONFIG`, constructing it on first use."""
+    global _AGENT_SINGLETON
+    if _AGENT_SINGLETON is None:
+        _AGENT_SINGLETON = build_research_agent(DEFAULT_CONFIG)
+    return _AGENT_SINGLETON
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from deep_agent.agent import agent` working without building at import time.
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
@@ -127,6 +559,18 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fail immediately if GOOGLE_API_KEY is missing instead of prompting via getpass.",
     )
+    parser.add_argument(
+        "--no-keyring",
+        action="store_true",
+        help="Do not read API keys from, or save prompted keys to, the OS keyring.",
+    )
+    parser.add_argument(
+        "--parallel-subtasks",
+        help=(
+            "Semicolon-separated subtasks (e.g. \"a;b;c\") to research concurrently before "
+            "synthesizing a single answer to the question."
+        ),
+    )
     return parser
 
 
@@ -139,9 +583,29 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         model=args.model,
         system_prompt=args.system_prompt or DEFAULT_CONFIG.system_prompt,
         prompt_for_google_key=not args.no_google_prompt,
+        use_keyring=not args.no_keyring,
     )
 
     question = args.question
+
+    if args.parallel_subtasks:
+        subtasks = [task.strip() for task in args.parallel_subtasks.split(";") if task.strip()]
+        if not subtasks:
+            parser.error("--parallel-subtasks needs at least one non-empty subtask.")
+        goal = question or input("Enter research goal: ").strip()
+        if not goal:
+            parser.error("A research question is required with --parallel-subtasks.")
+        # Build only after validating so usage errors don't prompt for API keys.
+        agent = build_research_agent(config)
+        findings = asyncio.run(_research_subtasks(subtasks, agent))
+        synthesis_prompt = _build_synthesis_prompt(goal, subtasks, findings)
+        for chunk in run_research_query_stream(synthesis_prompt, agent=agent):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        print()
+        return 0
+
+    agent = build_research_agent(config)
     while True:
         if not question:
             question = input("Enter research question (type 'quit' to exit): ").strip()
@@ -153,8 +617,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             question = None
             continue
 
-        response = run_research_query(question, config=config)
-        print(response)
+        for chunk in run_research_query_stream(question, agent=agent):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        print()
         print("-" * 40)
         question = None  # force prompt on next loop
 
@@ -168,9 +634,13 @@ if __name__ == "__main__":
 __all__ = [
     "ResearchAgentConfig",
     "build_internet_search_tool",
+    "build_internet_search_batch_tool",
     "build_research_agent",
     "run_research_query",
+    "run_research_query_stream",
+    "run_research_query_astream",
+    "run_research_query_parallel",
     "DEFAULT_CONFIG",
-    "agent",
+    "get_agent",
     "main",
 ]